@@ -7,6 +7,8 @@
 
 """Set of helper functions and classes."""
 
+import re
+
 
 _creation_order = 0
 def set_creation_order(self):
@@ -26,6 +28,21 @@ def maybe_callable(value, *args, **kwargs):
         return value
 
 
+_compiled_patterns = {}
+_compiled_patterns_limit = 512
+def compile_pattern(pattern, flags=0):
+    """Compile regular expression ``pattern`` with given ``flags`` or return
+    one compiled earlier for same arguments."""
+    key = (type(pattern), pattern, flags)
+    try:
+        return _compiled_patterns[key]
+    except KeyError:
+        if len(_compiled_patterns) >= _compiled_patterns_limit:
+            _compiled_patterns.clear()
+        compiled = _compiled_patterns[key] = re.compile(pattern, flags)
+        return compiled
+
+
 def is_mutable(value):
     """Return ``True`` if ``value`` is instance of mutable type or ``False``
     otherwise."""
@@ -18,10 +18,9 @@ def message_formatter(*message_ids):
     message has any). Example::
 
         class MyValidator(formify.Validator):
-            messages = dict(formify.Validator.messages)
-            messages.update({
+            messages = {
                 'my_message': 'Something wrong happend with value %(value)s'
-            })
+            }
 
             @message_formatter('my_message')
             def my_message_formatter(self, message_id, value):
@@ -15,6 +15,7 @@ class DictMixin(object):
     This is very similar to :class:`UserDict.DictMixin`, but ``__iter__`` must
     be defined instead of ``keys`` and new-style class is used.
     """
+    __slots__ = ()
 
     def __cmp__(self, other):
         if other is None:
@@ -25,6 +25,7 @@ class UnboundValidator(object):
     original :class:`Validator` subclass object with all constructor parameters
     and allow later binding to some owner.
     """
+    __slots__ = ('_creation_order', '_validator', '_args', '_kwargs')
 
     def __init__(self, validator, *args, **kwargs):
         _utils.set_creation_order(self)
@@ -33,6 +34,8 @@ class UnboundValidator(object):
         self._kwargs = dict(kwargs)
 
     def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)  # special names are never params
         return self._kwargs.get(name)
 
     def __setattr__(self, name, value):
@@ -67,14 +70,41 @@ class UnboundValidator(object):
 class ValidatorMeta(type):
     """Metaclass for :class:`Validator`."""
 
+    def __init__(cls, name, bases, dct):
+        super(ValidatorMeta, cls).__init__(name, bases, dct)
+        cls._declared_messages = dct.get('messages', {})
+        cls.messages = cls.__merge_messages()
+        cls._message_formatters = cls.__find_message_formatters()
+
     @property
     def __message_formatters__(cls):
-        """Map of custom message formatters."""
+        """Map of custom message formatters.
+
+        This map is created once class is created.
+        """
+        return cls._message_formatters
+
+    def __merge_messages(cls):
+        merged = {}
+        for klass in reversed(cls.__mro__):
+            if isinstance(klass, ValidatorMeta):
+                merged.update(klass._declared_messages)
+            else:
+                merged.update(klass.__dict__.get('messages', {}))
+        return dict(
+            (intern(key) if type(key) is str else key, value)
+            for key, value in merged.iteritems())
+
+    def __find_message_formatters(cls):
         formatters = {}
-        for name in dir(cls):
-            value = getattr(cls, name)
-            for message_id in getattr(value, '_ffy_message_formatter', []):
-                formatters[message_id] = value
+        visited = set()
+        for klass in cls.__mro__:
+            for name, value in klass.__dict__.iteritems():
+                if name in visited:
+                    continue  # overridden in one of subclasses
+                visited.add(name)
+                for message_id in getattr(value, '_ffy_message_formatter', []):
+                    formatters.setdefault(message_id, value)
         return formatters
 
 
@@ -122,6 +152,10 @@ class Validator(BaseValidator):
 
         Map of message templates used when rendering errors.
 
+        Messages declared in class body are merged with the ones inherited from
+        base classes once class is created, following method resolution order,
+        so subclasses only need to declare new or overridden messages.
+
         When raising :exc:`~formify.exc.FormifyError` exceptions, message
         template is searched in this map and rendered with exception params.
         Formatting of messages can be customized with
@@ -144,14 +178,13 @@ class Validator(BaseValidator):
         'conversion_error': 'Unable to convert %(value)r to %(python_type)r object',
         'required_error': 'This field is required'
     }
+    _convert_instances = False  # set to True to convert python_type input too
 
     def __new__(cls, *args, **kwargs):
-        if kwargs.get('standalone', False):
-            return object.__new__(cls, owner=object(), *args, **kwargs)
-        elif 'owner' not in kwargs:
-            return UnboundValidator(cls, *args, **kwargs)
+        if 'owner' in kwargs or kwargs.get('standalone', False):
+            return object.__new__(cls)
         else:
-            return object.__new__(cls, *args, **kwargs)
+            return UnboundValidator(cls, *args, **kwargs)
 
     def __init__(self, key=None, optional=False, default=None, owner=None,
             standalone=False, messages=None, preprocessors=None,
@@ -184,12 +217,15 @@ class Validator(BaseValidator):
         went wrong.
         """
         self.errors = []
-        self.raw_value = self.__copy_if_mutable(value)
-        if self.__needs_conversion(value):
-            value = self.preprocess(value)
-            value = self.try_convert(value)
-        if value is not None:
-            value = self.postprocess(value)
+        if value is None:
+            self.raw_value = value
+        else:
+            self.raw_value = self.__copy_if_mutable(value)
+            if not isinstance(value, self.python_type) or self._convert_instances:
+                value = self.preprocess(value)
+                value = self.try_convert(value)
+            if value is not None:
+                value = self.postprocess(value)
         try:
             self.value = value
         except AttributeError:
@@ -205,9 +241,6 @@ class Validator(BaseValidator):
         else:
             return value
 
-    def __needs_conversion(self, value):
-        return value is not None and not isinstance(value, self.python_type)
-
     def preprocess(self, value):
         """Execute chain of preprocessors on given value."""
         for func in self.preprocessors:
@@ -297,7 +330,7 @@ class Validator(BaseValidator):
         :param `**params`:
             message template parameters
         """
-        formatter = self.__class__.__message_formatters__.get(message_id)
+        formatter = self._message_formatters.get(message_id)
         if formatter is not None:
             return formatter(self, message_id, **params)
         else:
@@ -348,6 +381,7 @@ class Validator(BaseValidator):
         """Python type this validator converts to.
 
         This property is not defined by default and therefore must be
-        implemented in all subclasses.
+        implemented in all subclasses. If the type is constant, a plain class
+        attribute should be used instead of a property.
         """
         raise NotImplementedError("'python_type' is not implemented in %r" % self.__class__)
@@ -12,7 +12,7 @@ import decimal
 import datetime
 import collections
 
-from formify import exc, types
+from formify import _utils, exc, types
 from formify.decorators import message_formatter
 from formify.validators.base import Validator
 from formify.validators.mixins import LengthValidationMixin, RangeValidationMixin
@@ -21,16 +21,56 @@ __all__ = ['BaseString', 'String', 'Regex', 'URL', 'Email', 'Numeric',
     'Integer', 'Float', 'Decimal', 'Boolean', 'DateTime', 'Password', 'AnyOf',
     'BaseChoice', 'Choice', 'MultiChoice', 'EqualTo', 'List', 'Map']
 
+_URL_PATTERN = r'\A(?:(?:https?|ftp)://)?[a-zA-Z0-9\-]+(?:\.[a-zA-Z0-9\-]+)*\.[a-zA-Z]{2,3}(?:/\S*)?\Z'
+
+_EMAIL_PATTERN = r'\A[\w\-\.]+@[\w\-]+(?:\.[\w\-]+)*\.[\w\-]{2,4}\Z'
+
+# Numeric strptime directives mapped to datetime fields and fixed-width
+# patterns matching them
+_DATE_TIME_DIRECTIVES = {
+    'Y': ('year', r'\d{4}'),
+    'm': ('month', r'\d{2}'),
+    'd': ('day', r'\d{2}'),
+    'H': ('hour', r'\d{2}'),
+    'M': ('minute', r'\d{2}'),
+    'S': ('second', r'\d{2}')
+}
+
+
+def _compile_date_time_pattern(fmt):
+    """Compile pattern matching fixed-width form of date/time format
+    ``fmt``.
+
+    Returns ``None`` if ``fmt`` contains directives other than numeric ones
+    listed in ``_DATE_TIME_DIRECTIVES`` or uses any of them more than once.
+    """
+    parts = []
+    fields = set()
+    for i, token in enumerate(re.split(r'(%.)', fmt)):
+        if i % 2 == 0:
+            if '%' in token:
+                return None
+            parts.append(re.escape(token))
+        elif token == '%%':
+            parts.append('%')
+        elif token[1] in _DATE_TIME_DIRECTIVES:
+            field, pattern = _DATE_TIME_DIRECTIVES[token[1]]
+            if field in fields:
+                return None
+            fields.add(field)
+            parts.append('(?P<%s>%s)' % (field, pattern))
+        else:
+            return None
+    if fields:
+        return _utils.compile_pattern(r'\A%s\Z' % ''.join(parts))
+
 
 class BaseString(Validator):
     """Common base class for string validators.
 
     Converts to: ``unicode``
     """
-
-    @property
-    def python_type(self):
-        return unicode
+    python_type = unicode
 
 
 class String(BaseString, LengthValidationMixin):
@@ -41,12 +81,11 @@ class String(BaseString, LengthValidationMixin):
     :param max_length:
         maximal length of input value
     """
-    messages = dict(BaseString.messages)
-    messages.update({
+    messages = {
         'value_too_short': 'Expecting at least %(min_length)s characters',
         'value_too_long': 'Expecting at most %(max_length)s characters',
         'value_length_out_of_range': 'Expected number of characters is between %(min_length)s and %(max_length)s'
-    })
+    }
 
     def __init__(self, min_length=None, max_length=None, **kwargs):
         super(String, self).__init__(**kwargs)
@@ -62,16 +101,15 @@ class Regex(BaseString):
     :param flags:
         regular expression flags (see :mod:`re` for details)
     """
-    messages = dict(BaseString.messages)
-    messages.update({
+    messages = {
         'pattern_mismatch': 'Value does not match pattern %(pattern)s'
-    })
+    }
 
     def __init__(self, pattern, flags=0, **kwargs):
         super(Regex, self).__init__(**kwargs)
         self.pattern = pattern
         self.flags = flags
-        self._compiled_pattern = re.compile(pattern, flags)
+        self._compiled_pattern = _utils.compile_pattern(pattern, flags)
 
     def validate(self, value):
         if not self._compiled_pattern.match(value):
@@ -80,24 +118,22 @@ class Regex(BaseString):
 
 class URL(Regex):
     """Validate URL address."""
-    messages = dict(Regex.messages)
-    messages.update({
+    messages = {
         'pattern_mismatch': 'Invalid URL address'
-    })
+    }
 
     def __init__(self, **kwargs):
-        super(URL, self).__init__(r'^((http|https|ftp)\://)?([a-zA-Z0-9\-]+\.)+[a-zA-Z]{2,3}(/\S*)?$', **kwargs)
+        super(URL, self).__init__(_URL_PATTERN, **kwargs)
 
 
 class Email(Regex):
     """Validate e-mail address."""
-    messages = dict(Regex.messages)
-    messages.update({
+    messages = {
         'pattern_mismatch': 'Invalid e-mail address'
-    })
+    }
 
     def __init__(self, **kwargs):
-        super(Email, self).__init__(r'^[\w\-\.]+@([\w\-]+\.)+[\w\-]{2,4}$', **kwargs)
+        super(Email, self).__init__(_EMAIL_PATTERN, **kwargs)
 
 
 class Numeric(Validator, RangeValidationMixin):
@@ -108,12 +144,11 @@ class Numeric(Validator, RangeValidationMixin):
     :param max_value:
         maximal input value
     """
-    messages = dict(Validator.messages)
-    messages.update({
+    messages = {
         'value_too_low': 'Expecting value greater or equal to %(min_value)s',
         'value_too_high': 'Expecting value less or equal to %(max_value)s',
         'value_out_of_range': 'Expecting value between %(min_value)s and %(max_value)s'
-    })
+    }
 
     def __init__(self, min_value=None, max_value=None, **kwargs):
         super(Numeric, self).__init__(**kwargs)
@@ -126,10 +161,7 @@ class Integer(Numeric):
 
     Converts to: ``int``
     """
-
-    @property
-    def python_type(self):
-        return int
+    python_type = int
 
 
 class Float(Numeric):
@@ -137,10 +169,7 @@ class Float(Numeric):
 
     Converts to: ``float``
     """
-
-    @property
-    def python_type(self):
-        return float
+    python_type = float
 
 
 class Decimal(Numeric):
@@ -148,10 +177,7 @@ class Decimal(Numeric):
 
     Converts to: :class:`decimal.Decimal`
     """
-
-    @property
-    def python_type(self):
-        return decimal.Decimal
+    python_type = decimal.Decimal
 
 
 class Boolean(Validator):
@@ -176,15 +202,16 @@ class Boolean(Validator):
     :param falses:
         specify custom false-evaluating phrases
     """
+    python_type = bool
     trues = set(['1', 'y', 'yes', 'on', 'true'])
     falses = set(['0', 'n', 'no', 'off', 'false'])
 
     def __init__(self, trues=None, falses=None, **kwargs):
-        super(Boolean, self).__init__(**kwargs)
         if trues is not None:
-            self.trues = set(trues)
+            self.trues = frozenset(trues)
         if falses is not None:
-            self.falses = set(falses)
+            self.falses = frozenset(falses)
+        super(Boolean, self).__init__(**kwargs)
 
     def convert(self, value):
         if isinstance(value, basestring):
@@ -208,10 +235,6 @@ class Boolean(Validator):
             raise exc.ConversionError('conversion_error',
                 value=value, python_type=self.python_type)
 
-    @property
-    def python_type(self):
-        return bool
-
 
 class DateTime(Validator, RangeValidationMixin):
     """Validate date/time input.
@@ -228,14 +251,14 @@ class DateTime(Validator, RangeValidationMixin):
     :param max_value:
         maximal allowed date/time
     """
-    messages = dict(Validator.messages)
-    messages.update({
+    python_type = datetime.datetime
+    messages = {
         'conversion_error': 'Input date/time does not match format %(fmt)s',
         'invalid_input': 'Can only parse strings',
         'value_too_low': 'Minimal date is %(min_value)s',
         'value_too_high': 'Maximal date is %(max_value)s',
         'value_out_of_range': 'Expecting date between %(min_value)s and %(max_value)s'
-    })
+    }
 
     @message_formatter('value_too_low', 'value_too_high', 'value_out_of_range')
     def _format_date_time(self, message_id, min_value=None, max_value=None):
@@ -248,13 +271,18 @@ class DateTime(Validator, RangeValidationMixin):
             'max_value': max_value}
 
     def __to_string(self, value):
-        return datetime.datetime.strftime(value, self.fmt)
+        key = (value, self.fmt)
+        if key not in self._formatted_values:
+            self._formatted_values[key] = datetime.datetime.strftime(value, self.fmt)
+        return self._formatted_values[key]
 
     def __init__(self, fmt, min_value=None, max_value=None, **kwargs):
-        super(DateTime, self).__init__(**kwargs)
         self.fmt = fmt
         self.min_value = min_value
         self.max_value = max_value
+        self._fmt_pattern = _compile_date_time_pattern(fmt)
+        self._formatted_values = {}
+        super(DateTime, self).__init__(**kwargs)
 
     def convert(self, value):
         if not isinstance(value, basestring):
@@ -263,31 +291,47 @@ class DateTime(Validator, RangeValidationMixin):
             return self.__from_string(value)
 
     def __from_string(self, value):
+        if self._fmt_pattern is not None:
+            match = self._fmt_pattern.match(value)
+            if match is not None:
+                try:
+                    return self.__from_fields(match.groupdict())
+                except ValueError:
+                    pass  # let strptime report the error
         try:
             return datetime.datetime.strptime(value, self.fmt)
         except ValueError:
             raise exc.ConversionError('conversion_error',
                 value=value, python_type=self.python_type, fmt=self.fmt)
 
-    @property
-    def python_type(self):
-        return datetime.datetime
+    def __from_fields(self, fields):
+        return datetime.datetime(
+            int(fields.get('year', 1900)),
+            int(fields.get('month', 1)),
+            int(fields.get('day', 1)),
+            int(fields.get('hour', 0)),
+            int(fields.get('minute', 0)),
+            int(fields.get('second', 0)))
 
 
 class Password(String):
     """Validate password input.
 
     This validator accepts string input and creates hash for it using specified
-    hash algorithm. Hashed value is then used as output value.
+    hash algorithm. Input is encoded with UTF-8 before hashing. Hashed value
+    is then used as output value. Input is always converted, even if it
+    already is ``unicode``.
 
     :param hash_algorithm:
         name of hash algorithm to be used (``sha1`` by default). See
         :mod:`hashlib` for details
     """
+    _convert_instances = True
 
     def __init__(self, hash_algorithm='sha1', **kwargs):
-        super(Password, self).__init__(**kwargs)
         self.hash_algorithm = hash_algorithm
+        self._hash_prototype_algorithm = self._hash_prototype = None
+        super(Password, self).__init__(**kwargs)
 
     def convert(self, value):
         value = super(Password, self).convert(value)
@@ -295,10 +339,17 @@ class Password(String):
         return self.__create_hash(value)
 
     def __create_hash(self, value):
-        hash_obj = hashlib.new(self.hash_algorithm)
-        hash_obj.update(value)
+        hash_obj = self.__get_hash_prototype().copy()
+        hash_obj.update(value.encode('utf-8'))
         return hash_obj.hexdigest()
 
+    def __get_hash_prototype(self):
+        algorithm = self.hash_algorithm
+        if self._hash_prototype_algorithm != algorithm:
+            self._hash_prototype = hashlib.new(algorithm)
+            self._hash_prototype_algorithm = algorithm
+        return self._hash_prototype
+
     def validate(self, value):
         super(Password, self).validate(self._converted_value)
 
@@ -311,32 +362,36 @@ class AnyOf(Validator):
     validating, previously found validator is used, but another one is tried
     (if there are any left) if validation fails.
 
+    Subvalidators are created once, together with this validator, and reused
+    for each processed value.
+
     :param validators:
         list of subvalidators
     """
 
     def __init__(self, validators, **kwargs):
         self.validators = validators
+        self._bound_validators = [x(owner=self) for x in validators]
         super(AnyOf, self).__init__(**kwargs)
 
     def __call__(self, value):
         self.raw_value = value
         self._index_of_current = -1
-        self._bound_validators = [x(owner=self) for x in self.validators]
         for i, validator in enumerate(self._bound_validators):
             if validator(value) is not None:
                 self._index_of_current = i
                 return self.value
 
     def try_validate(self, value):
-        for i in xrange(self._index_of_current, len(self._bound_validators)):
+        current = self._index_of_current
+        if current >= 0 and self._bound_validators[current].is_valid():
+            return True
+        for i in xrange(current + 1, len(self._bound_validators)):
             validator = self._bound_validators[i]
-            if validator(value) is not None:
-                if validator.is_valid():
-                    self._index_of_current = i
-                    return True
-        else:
-            return False
+            if validator(value) is not None and validator.is_valid():
+                self._index_of_current = i
+                return True
+        return False
 
     @property
     def validator(self):
@@ -384,18 +439,18 @@ class BaseChoice(Validator):
             self._options = collections.OrderedDict(value)
         except ValueError:
             self._options = collections.OrderedDict([(k, k) for k in value])
+        self._option_keys = frozenset(self._options)
 
 
 class Choice(BaseChoice):
     """Validates if input data matches any of predefined options."""
-    messages = dict(Validator.messages)
-    messages.update({
+    messages = {
         'invalid_option': 'Invalid option: %(key)s'
-    })
+    }
 
     def validate(self, value):
         super(Choice, self).validate(value)
-        if value not in self.options:
+        if value not in self._option_keys:
             raise exc.ValidationError('invalid_option', key=value)
 
     @property
@@ -406,44 +461,31 @@ class Choice(BaseChoice):
 class MultiChoice(BaseChoice):
     """Validates if every item of input data set matches any of predefined
     options."""
-    messages = dict(Validator.messages)
-    messages.update({
+    python_type = set
+    messages = {
         'invalid_options': 'Invalid options: %(keys)s',
         'key_conversion_error': 'Unable to convert %(key)r to %(key_type)r object'
-    })
+    }
 
     def try_convert(self, value):
         value = super(MultiChoice, self).try_convert(value)
         if value is None:
             return value
         result = self.python_type()
-        for v in value:
-            result.add(self.__try_convert_key(v))
+        add, key_type = result.add, self.key_type
+        for key in value:
+            try:
+                add(key_type(key))
+            except Exception:
+                self.add_error('key_conversion_error', key=key, key_type=key_type)
+                add(None)
         return result
 
-    def __try_convert_key(self, key):
-        try:
-            return self.__convert_key(key)
-        except exc.ConversionError, e:
-            self.add_error(e.message_id, **e.params)
-
-    def __convert_key(self, key):
-        try:
-            return self.key_type(key)
-        except Exception, e:
-            raise exc.ConversionError('key_conversion_error',
-                key=key, key_type=self.key_type)
-
     def validate(self, value):
         super(MultiChoice, self).validate(value)
-        common_options = set(self.options).intersection(value)
-        if common_options != value:
-            raise exc.ValidationError('invalid_options',
-                keys=value.difference(common_options))
-
-    @property
-    def python_type(self):
-        return set
+        invalid_options = value.difference(self._option_keys)
+        if invalid_options:
+            raise exc.ValidationError('invalid_options', keys=invalid_options)
 
 
 class EqualTo(Validator):
@@ -455,10 +497,9 @@ class EqualTo(Validator):
     :param key:
         key of validator to compare input with
     """
-    messages = dict(Validator.messages)
-    messages.update({
+    messages = {
         'not_equal': 'Values are not equal'
-    })
+    }
 
     def __init__(self, key, **kwargs):
         if 'owner' not in kwargs:
@@ -467,18 +508,20 @@ class EqualTo(Validator):
         self.key = key
 
     def try_convert(self, value):
+        validator = self.validator
         try:
-            return self.validator.convert(value)
+            return validator.convert(value)
         except exc.ConversionError, e:
-            self.__add_external_error(e.message_id, **e.params)
+            self.__add_external_error(validator, e.message_id, **e.params)
 
-    def __add_external_error(self, message_id, **params):
-        message = self.validator.format_message(message_id, **params)
+    def __add_external_error(self, validator, message_id, **params):
+        message = validator.format_message(message_id, **params)
         self.errors.append(message)
 
     def validate(self, value):
         super(EqualTo, self).validate(value)
-        if self.value != self.validator.value:
+        other = self.validator.value
+        if value is not other and value != other:
             raise exc.ValidationError('not_equal')
 
     @property
@@ -489,27 +532,41 @@ class EqualTo(Validator):
     def python_type(self):
         return self.validator.python_type
 
+    @property
+    def _convert_instances(self):
+        return self.validator._convert_instances
+
 
 class List(Validator, LengthValidationMixin):
     """Validates list of input data using given validator.
 
     :param validator:
         validator used to validate input data
+    :param min_length:
+        minimal number of elements
+    :param max_length:
+        maximal number of elements
+    :param fast_fail:
+        set to ``True`` to stop validating inner validators after first one
+        has failed. By default all inner validators are validated, so each of
+        them has its errors set
     """
-    messages = dict(Validator.messages)
-    messages.update({
-        'too_short': 'Expecting at least %(min_length)s elements',
-        'too_long': 'Expecting at most %(max_length)s elements',
-        'length_out_of_range': 'Expected number of elements is between %(min_length)s and %(max_length)s',
+    python_type = list
+    messages = {
+        'value_too_short': 'Expecting at least %(min_length)s elements',
+        'value_too_long': 'Expecting at most %(max_length)s elements',
+        'value_length_out_of_range': 'Expected number of elements is between %(min_length)s and %(max_length)s',
         'inner_validator_error': 'At least one inner validator has failed'
-    })
+    }
 
-    def __init__(self, validator, min_length=None, max_length=None, **kwargs):
-        super(List, self).__init__(**kwargs)
+    def __init__(self, validator, min_length=None, max_length=None,
+            fast_fail=False, **kwargs):
         self.validator = validator
         self.min_length = min_length
         self.max_length = max_length
+        self.fast_fail = fast_fail
         self._value_validators = []
+        super(List, self).__init__(**kwargs)
 
     def __iter__(self):
         for validator in self._value_validators:
@@ -521,32 +578,30 @@ class List(Validator, LengthValidationMixin):
     def __getitem__(self, index):
         return self._value_validators[index]
 
-    @property
-    def python_type(self):
-        return list
-
     def postprocess(self, value):
         value = super(List, self).postprocess(value)
-        self._value_validators = self.__create_value_validators(value)
-        for i, validator in enumerate(self._value_validators):
-            value[i] = validator.value
+        self._value_validators = self.__process_values(value)
         return value
 
-    def __create_value_validators(self, value):
-        validators = []
-        for v in (value or []):
-            validator = self.validator(owner=self)
+    def __process_values(self, value):
+        factory, validators = self.validator, []
+        append = validators.append
+        for i, v in enumerate(value):
+            validator = factory(owner=self)
             validator(v)
-            validators.append(validator)
+            value[i] = validator.value
+            append(validator)
         return validators
 
     def is_valid(self):
-        status = super(List, self).is_valid()
-        if not status:
+        if not super(List, self).is_valid():
             return False
-        for v in self:
-            if not v.is_valid():
+        status = True
+        for validator in self._value_validators:
+            if not validator.is_valid():
                 status = False
+                if self.fast_fail:
+                    break
         if not status:
             self.add_error('inner_validator_error')
         return status
@@ -559,8 +614,10 @@ class Map(Validator):
         map of validators. This can be dict or :class:`~formify.schema.Schema`
         class object.
     """
+    python_type = dict
 
     class _ValueProxy(types.DictMixin):
+        __slots__ = ('__owner',)
 
         def __init__(self, owner):
             self._owner = owner
@@ -573,9 +630,25 @@ class Map(Validator):
         def _owner(self, value):
             self.__owner = weakref.ref(value)
 
+        def __eq__(self, other):
+            if not hasattr(other, 'iteritems'):
+                return self.__cmp__(other) == 0
+            bound_validators = self._owner._bound_validators
+            if len(other) != len(bound_validators):
+                return False
+            for k, v in other.iteritems():
+                if k not in bound_validators or bound_validators[k].value != v:
+                    return False
+            return True
+
+        def __ne__(self, other):
+            return not self == other
+
         def __iter__(self):
-            for key in self._owner._bound_validators:
-                yield key
+            return iter(self._owner._keys)
+
+        def __len__(self):
+            return len(self._owner._bound_validators)
 
         def __getitem__(self, key):
             return self._owner._bound_validators[key].value
@@ -593,12 +666,14 @@ class Map(Validator):
                 self[name] = value
 
     def __init__(self, validators, **kwargs):
-        super(Map, self).__init__(**kwargs)
         self.validators = validators
         if hasattr(validators, '__validators__'):
             self._bound_validators = self.__bind_validators(validators.__validators__)
         else:
             self._bound_validators = self.__bind_validators(validators)
+        self._keys = tuple(self._bound_validators)
+        self._value_validators = self._bound_validators.values()
+        super(Map, self).__init__(**kwargs)
 
     def __bind_validators(self, validators):
         bound = collections.OrderedDict()
@@ -607,31 +682,27 @@ class Map(Validator):
         return bound
 
     def __iter__(self):
-        for k in self._bound_validators:
-            yield k
+        return iter(self._keys)
 
     def __getitem__(self, key):
         return self._bound_validators[key]
 
-    @property
-    def python_type(self):
-        return dict
-
     @property
     def value(self):
         return self._ValueProxy(self)
 
     def postprocess(self, value):
         value = super(Map, self).postprocess(value)
-        for k, v in value.items():
-            self._bound_validators[k](v)
+        bound_validators = self._bound_validators
+        for k, v in value.iteritems():
+            bound_validators[k](v)
         return value
 
     def is_valid(self):
         if self.errors:
             return False
         status = True
-        for v in self._bound_validators.itervalues():
-            if not v.is_valid():
+        for validator in self._value_validators:
+            if not validator.is_valid():
                 status = False
         return status
@@ -11,11 +11,10 @@ from formify.validators.general import Regex
 
 class BaseISBN(Regex):
     """Base class for ISBN number validators."""
-    messages = dict(Regex.messages)
-    messages.update({
+    messages = {
         'pattern_mismatch': 'Not a valid ISBN number',
         'checksum_mismatch': 'Invalid checksum digit: found %(found)s, expecting %(expected)s)'
-    })
+    }
 
     def __init__(self, **kwargs):
         super(BaseISBN, self).__init__(self.isbn_re, **kwargs)
@@ -39,16 +38,11 @@ class BaseISBN(Regex):
 
 class ISBN10(BaseISBN):
     """Validates ISBN10 numbers."""
-    isbn_re = r'^\d+-\d+-\d+-\d$'
+    isbn_re = r'\A\d+-\d+-\d+-\d\Z'
 
     def calculate_checksum(self, value):
-        checksum = ndash = 0
-        for i in xrange(len(value)-1):
-            if value[i] != '-':
-                checksum += (i - ndash + 1) * int(value[i])
-            else:
-                ndash += 1
-        checksum %= 11
+        digits = value[:-1].replace('-', '')
+        checksum = sum(i * (ord(d) - 48) for i, d in enumerate(digits, 1)) % 11
         if checksum == 10:
             return 'X'
         else:
@@ -57,18 +51,13 @@ class ISBN10(BaseISBN):
 
 class ISBN13(BaseISBN):
     """Validates ISBN13 numbers."""
-    isbn_re = r'^((978|979)-)?\d+-\d+-\d+-\d+$'
+    isbn_re = r'\A(?:97[89]-)?\d+-\d+-\d+-\d+\Z'
 
     def calculate_checksum(self, value):
-        checksum = ndash = 0
-        for i in xrange(len(value)-1):
-            if value[i] == '-':
-                ndash += 1
-            else:
-                if (i - ndash) % 2:
-                    checksum += int(value[i]) * 3
-                else:
-                    checksum += int(value[i])
+        digits = value[:-1].replace('-', '')
+        odd, even = digits[::2], digits[1::2]
+        checksum = sum(map(ord, odd)) - 48 * len(odd)
+        checksum += 3 * (sum(map(ord, even)) - 48 * len(even))
         checksum %= 10
         if checksum == 0:
             return '0'
@@ -27,26 +27,18 @@ class LengthValidationMixin(BaseValidator):
 
     def validate(self, value):
         super(LengthValidationMixin, self).validate(value)
-        if self.min_length is not None and self.max_length is not None:
-            self.__validate_length_range(value)
-        elif self.min_length is not None:
-            self.__validate_min_length(value)
-        elif self.max_length is not None:
-            self.__validate_max_length(value)
-
-    def __validate_length_range(self, value):
-        if not self.min_length <= len(value) <= self.max_length:
-            raise exc.ValidationError('value_length_out_of_range',
-                min_length=self.min_length,
-                max_length=self.max_length)
-
-    def __validate_min_length(self, value):
-        if len(value) < self.min_length:
-            raise exc.ValidationError('value_too_short', min_length=self.min_length)
-
-    def __validate_max_length(self, value):
-        if len(value) > self.max_length:
-            raise exc.ValidationError('value_too_long', max_length=self.max_length)
+        min_length, max_length = self.min_length, self.max_length
+        if min_length is None:
+            if max_length is not None and len(value) > max_length:
+                raise exc.ValidationError('value_too_long', max_length=max_length)
+        elif max_length is None:
+            if len(value) < min_length:
+                raise exc.ValidationError('value_too_short', min_length=min_length)
+        else:
+            length = len(value)
+            if length < min_length or length > max_length:
+                raise exc.ValidationError('value_length_out_of_range',
+                    min_length=min_length, max_length=max_length)
 
 
 class RangeValidationMixin(BaseValidator):
@@ -66,22 +58,13 @@ class RangeValidationMixin(BaseValidator):
 
     def validate(self, value):
         super(RangeValidationMixin, self).validate(value)
-        if self.min_value is not None and self.max_value is not None:
-            self.__validate_value_range(value)
-        elif self.min_value is not None:
-            self.__validate_min_value(value)
-        elif self.max_value is not None:
-            self.__validate_max_value(value)
-
-    def __validate_value_range(self, value):
-        if not self.min_value <= value <= self.max_value:
+        min_value, max_value = self.min_value, self.max_value
+        if min_value is None:
+            if max_value is not None and value > max_value:
+                raise exc.ValidationError('value_too_high', max_value=max_value)
+        elif max_value is None:
+            if value < min_value:
+                raise exc.ValidationError('value_too_low', min_value=min_value)
+        elif not min_value <= value <= max_value:
             raise exc.ValidationError('value_out_of_range',
-                min_value=self.min_value, max_value=self.max_value)
-
-    def __validate_min_value(self, value):
-        if value < self.min_value:
-            raise exc.ValidationError('value_too_low', min_value=self.min_value)
-
-    def __validate_max_value(self, value):
-        if value > self.max_value:
-            raise exc.ValidationError('value_too_high', max_value=self.max_value)
+                min_value=min_value, max_value=max_value)
@@ -116,3 +116,54 @@ class TestValidator(unittest.TestCase):
         data = tuple()
         self.uut(data)
         self.assertIs(data, self.uut.raw_value)
+
+    def test_whenSubclassDeclaresMessages_theyAreMergedWithInheritedOnes(self):
+
+        class Sub(self.UUT):
+            messages = {
+                'conversion_error': 'Not an integer',
+                'custom_error': 'Custom error'
+            }
+
+        self.assertEqual('Not an integer', Sub.messages['conversion_error'])
+        self.assertEqual('Custom error', Sub.messages['custom_error'])
+        self.assertEqual('This field is required', Sub.messages['required_error'])
+        self.assertNotIn('custom_error', self.UUT.messages)
+
+    def test_whenMixinDeclaresMessages_theyAreMergedInMethodResolutionOrder(self):
+
+        class Base(formify.Validator):
+            messages = {'base_error': 'Base error'}
+
+        class Mixin(formify.Validator):
+            messages = {'required_error': 'Mixin required'}
+
+        class Sub(Base, Mixin):
+            messages = {'custom_error': 'Custom error'}
+
+        class PlainSub(Base, Mixin):
+            pass
+
+        for klass in (Sub, PlainSub):
+            self.assertEqual('Mixin required', klass.messages['required_error'])
+            self.assertEqual('Base error', klass.messages['base_error'])
+        self.assertEqual('Custom error', Sub.messages['custom_error'])
+
+    def test_whenUnboundValidatorIsModifiedAfterBinding_nextBindingUsesNewParams(self):
+        unbound = self.UUT(optional=True)
+        self.assertTrue(unbound(owner=self).optional)
+
+        unbound.optional = False
+        self.assertFalse(unbound(owner=self).optional)
+
+    def test_whenUnboundValidatorKwargsAreModifiedAfterBinding_nextBindingUsesNewParams(self):
+        unbound = self.UUT(optional=True)
+        self.assertTrue(unbound(owner=self).optional)
+
+        unbound.kwargs['optional'] = False
+        self.assertFalse(unbound(owner=self).optional)
+
+    def test_unboundValidatorDoesNotResolveSpecialNamesToParams(self):
+        unbound = self.UUT()
+        self.assertIsNone(unbound.default)
+        self.assertFalse(hasattr(unbound, '__iter__'))
@@ -5,6 +5,7 @@
 # This module is part of Formify and is released under the MIT license:
 # http://opensource.org/licenses/mit-license.php
 
+import re
 import decimal
 import datetime
 import unittest
@@ -42,6 +43,17 @@ class TestRegex(unittest.TestCase):
         self.assertEqual('0x123', self.uut.value)
         self.assertEqual('Value does not match pattern ^[0-9]+$', self.uut.errors[0])
 
+    def test_validatorsWithSamePatternShareCompiledPattern(self):
+        unbound = formify.Regex(r'^[0-9]+$')
+
+        first, second = unbound(owner=self), unbound(owner=self)
+
+        self.assertIs(first._compiled_pattern, second._compiled_pattern)
+        self.assertIs(self.uut._compiled_pattern, first._compiled_pattern)
+        self.assertIsNot(
+            self.uut._compiled_pattern,
+            formify.Regex(r'^[0-9]+$', flags=re.I, standalone=True)._compiled_pattern)
+
 
 class TestURL(unittest.TestCase):
 
@@ -76,6 +88,12 @@ class TestURL(unittest.TestCase):
         uut('http://example')
         self.assertFalse(uut.is_valid())
 
+    def test_ifValidUrlFollowedByNewlineGiven_validationFails(self):
+        uut = formify.URL(standalone=True)
+
+        uut('http://www.example.com\n')
+        self.assertFalse(uut.is_valid())
+
 
 class TestEmail(unittest.TestCase):
 
@@ -107,6 +125,12 @@ class TestEmail(unittest.TestCase):
         uut('foo@bar.baz.spaaam')
         self.assertFalse(uut.is_valid())
 
+    def test_ifValidEmailFollowedByNewlineGiven_validationFails(self):
+        uut = formify.Email(standalone=True)
+
+        uut('foo@bar.baz\n')
+        self.assertFalse(uut.is_valid())
+
 
 class NumericTestsMixin(object):
     messages = {
@@ -225,6 +249,26 @@ class TestBoolean(unittest.TestCase):
         self.assertFalse(uut.is_valid())
         self.assertIn("Unable to convert 'N' to <type 'bool'> object", uut.errors)
 
+    def test_customTruesAreUsedForDefaultValue(self):
+        uut = formify.Boolean(trues=['T'], falses=['F'], default='T', standalone=True)
+
+        self.assertIs(uut.value, True)
+
+    def test_whenPhrasesAreReassigned_newPhrasesAreUsed(self):
+        uut = formify.Boolean(standalone=True)
+
+        uut.trues = frozenset(['si'])
+        self.assertIs(uut('si'), True)
+        self.assertIs(uut('yes'), None)
+
+    def test_whenDefaultPhrasesAreExtended_newPhrasesAreUsed(self):
+        formify.Boolean.trues.add('si')
+        try:
+            self.assertIs(formify.Boolean(standalone=True)('si'), True)
+        finally:
+            formify.Boolean.trues.discard('si')
+        self.assertIs(formify.Boolean(standalone=True)('si'), None)
+
     def test_validInputData(self):
         uut = formify.Boolean(standalone=True)
 
@@ -262,6 +306,34 @@ class TestDateTime(unittest.TestCase):
 
         self.assertEqual(datetime.datetime(2000, 1, 1, 7, 30, 59), self.uut.value)
 
+    def test_parseFromStringThatMatchesIsoPatternButIsNotValidDate(self):
+        self.uut('2000-02-30 07:30:59')
+
+        self.assertIs(self.uut.value, None)
+        self.assertIn('Input date/time does not match format %Y-%m-%d %H:%M:%S', self.uut.errors)
+
+    def test_parseFromStringWithSingleDigitFields(self):
+        self.uut('2000-1-1 7:30:59')
+
+        self.assertEqual(datetime.datetime(2000, 1, 1, 7, 30, 59), self.uut.value)
+
+    def test_parseFromStringThatMatchesCustomNumericPattern(self):
+        uut = formify.DateTime('%d.%m.%Y %H:%M', standalone=True)
+
+        uut('31.12.1999 23:59')
+        self.assertEqual(datetime.datetime(1999, 12, 31, 23, 59), uut.value)
+
+        uut('31.12.1999 23:5')
+        self.assertEqual(datetime.datetime(1999, 12, 31, 23, 5), uut.value)
+
+        uut('31.13.1999 23:59')
+        self.assertIs(uut.value, None)
+
+    def test_parseFromStringUsingDefaultValue(self):
+        uut = formify.DateTime('%Y-%m-%d', default='2000-01-01', standalone=True)
+
+        self.assertEqual(datetime.datetime(2000, 1, 1), uut.value)
+
     def test_parseFromStringThatDoesNotMatchPattern(self):
         self.uut('2000-01-01')
 
@@ -339,6 +411,46 @@ class TestPassword(unittest.TestCase):
         self.assertEqual('A', uut.raw_value)
         self.assertEqual('6dcd4ce23d88e2ee9568ba546c007c63d9131c1b', uut.value)
 
+    def test_whenProcessingAgain_hashDoesNotDependOnPreviousInput(self):
+        uut = formify.Password(hash_algorithm='md5', standalone=True)
+
+        uut('B')
+        uut('A')
+
+        self.assertEqual('7fc56270e7a70fa81a5935b72eacbe29', uut.value)
+
+    def test_whenHashAlgorithmIsReassigned_newAlgorithmIsUsed(self):
+        uut = formify.Password(standalone=True)
+        uut('A')
+
+        uut.hash_algorithm = 'md5'
+        uut('A')
+
+        self.assertEqual('7fc56270e7a70fa81a5935b72eacbe29', uut.value)
+
+    def test_hashIsProducedForNonAsciiInput(self):
+        uut = formify.Password(standalone=True)
+
+        uut(u'za\u017c\xf3\u0142\u0107')
+
+        self.assertTrue(uut.is_valid())
+        self.assertEqual('92ae8bcb9b2481b38693bd2f3b742bf5729ddc1f', uut.value)
+
+    def test_whenConfirmedWithEqualTo_bothValuesAreHashed(self):
+        uut = formify.Map({
+            'password': formify.Password(),
+            'confirm': formify.EqualTo('password')}, standalone=True)
+
+        for value in ('secret', u'secret', u'za\u017c\xf3\u0142\u0107'):
+            uut({'password': value, 'confirm': value})
+            self.assertTrue(uut.is_valid())
+            self.assertEqual(uut['password'].value, uut['confirm'].value)
+            self.assertNotEqual(value, uut['password'].value)
+
+        uut({'password': 'secret', 'confirm': 'other'})
+        self.assertFalse(uut.is_valid())
+        self.assertIn('Values are not equal', uut['confirm'].errors)
+
     def test_passwordTooShort(self):
         uut = formify.Password(min_length=4, max_length=8, standalone=True)
 
@@ -417,6 +529,21 @@ class TestAnyOf(unittest.TestCase):
         self.assertIsInstance(self.uut.validator, formify.Float)
         self.assertEqual(-1.0, self.uut.value)
 
+    def test_whenCurrentValidatorIsValid_itIsNotProcessedAgain(self):
+        self.uut('2')
+
+        self.assertTrue(self.uut.is_valid())
+        self.assertIsInstance(self.uut.validator, formify.Integer)
+        self.assertEqual('2', self.uut.validator.raw_value)
+
+    def test_whenProcessingAgain_subvalidatorsAreReused(self):
+        self.uut('1')
+        integer = self.uut.validator
+
+        self.uut('2')
+
+        self.assertIs(integer, self.uut.validator)
+
 
 class TestBaseChoice(unittest.TestCase):
 
@@ -604,6 +731,52 @@ class TestList(unittest.TestCase):
         self.assertFalse(self.uut[1].is_valid())
         self.assertFalse(self.uut[3].is_valid())
 
+    def test_whenProcessingAgain_previousValueValidatorsAreLeftIntact(self):
+        self.uut('12')
+        first, second = self.uut[0], self.uut[1]
+
+        self.uut('345')
+
+        self.assertEqual(1, first.value)
+        self.assertEqual(2, second.value)
+        self.assertEqual([3, 4, 5], [x.value for x in self.uut])
+
+    def test_whenMapKeyIsMissingInNextCall_itIsNotTakenFromPreviousCall(self):
+        uut = formify.List(
+            formify.Map({'a': formify.Integer, 'b': formify.Integer}),
+            standalone=True)
+
+        uut([{'a': '1', 'b': '2'}])
+        self.assertTrue(uut.is_valid())
+
+        uut([{'a': '3'}])
+        self.assertEqual(3, uut.value[0]['a'])
+        self.assertIs(None, uut.value[0]['b'])
+        self.assertFalse(uut.is_valid())
+
+    def test_whenElementIsNone_valueOfInnerValidatorIsUsed(self):
+        uut = formify.List(formify.Map({'a': formify.Integer}), standalone=True)
+
+        uut([None])
+
+        self.assertIsNot(None, uut.value[0])
+        self.assertIs(None, uut.value[0]['a'])
+
+    def test_whenInnerValidatorIsChangedAfterCreation_newParamsAreUsed(self):
+        inner = formify.Integer()
+        uut = formify.List(inner, standalone=True)
+
+        inner.max_value = 10
+        uut(['11'])
+
+        self.assertEqual(10, uut[0].max_value)
+        self.assertFalse(uut.is_valid())
+
+    def test_defaultValue(self):
+        uut = formify.List(formify.Integer, default=['1', '2'], standalone=True)
+
+        self.assertEqual([1, 2], uut.value)
+
     def test_whenCheckingValidity_innerValidatorsAffectTheResult(self):
         uut = formify.List(formify.Integer(max_value=3), standalone=True)
 
@@ -613,6 +786,35 @@ class TestList(unittest.TestCase):
         uut([4])
         self.assertFalse(uut.is_valid())
 
+    def test_whenCheckingValidity_allInnerValidatorsAreValidated(self):
+        uut = formify.List(formify.Integer(max_value=3), standalone=True)
+
+        uut([4, 5])
+
+        self.assertFalse(uut.is_valid())
+        self.assertTrue(uut[0].errors)
+        self.assertTrue(uut[1].errors)
+
+    def test_whenCheckingValidityInFastFailMode_validationStopsAtFirstFailure(self):
+        uut = formify.List(formify.Integer(max_value=3), fast_fail=True, standalone=True)
+
+        uut([4, 5])
+
+        self.assertFalse(uut.is_valid())
+        self.assertEqual(['At least one inner validator has failed'], uut.errors)
+        self.assertTrue(uut[0].errors)
+        self.assertFalse(uut[1].errors)
+
+    def test_whenNumberOfElementsIsOutOfRange_validationFails(self):
+        uut = formify.List(formify.Integer, min_length=2, max_length=3, standalone=True)
+
+        uut(['1'])
+        self.assertFalse(uut.is_valid())
+        self.assertIn('Expected number of elements is between 2 and 3', uut.errors)
+
+        uut(['1', '2'])
+        self.assertTrue(uut.is_valid())
+
 
 class TestMap(unittest.TestCase):
 
@@ -678,6 +880,16 @@ class TestMap(unittest.TestCase):
         self.assertEqual({'a': None, 'b': '2'}, self.uut.value)
         self.assertFalse(self.uut.is_valid())
 
+    def test_comparingValueWithMaps(self):
+        self.uut({'a': '1', 'b': 2})
+
+        self.assertTrue(self.uut.value == {'a': 1, 'b': '2'})
+        self.assertFalse(self.uut.value != {'a': 1, 'b': '2'})
+        self.assertTrue(self.uut.value != {'a': 1, 'b': '3'})
+        self.assertTrue(self.uut.value != {'a': 1})
+        self.assertTrue(self.uut.value != {'a': 1, 'c': '2'})
+        self.assertTrue(self.uut.value != None)
+
     def test_whenValidationOfElementFails_correspondingInnerValidatorContainsErrors(self):
         uut = formify.Map({'a': formify.Integer(max_value=2)}, standalone=True)
 
@@ -712,6 +924,11 @@ class TestMap(unittest.TestCase):
     def test_defaultValue(self):
         self.assertEqual({'a': None, 'b': None}, self.uut.value)
 
+    def test_customDefaultValue(self):
+        uut = formify.Map(self.Schema, default={'a': '1', 'b': 2}, standalone=True)
+
+        self.assertEqual({'a': 1, 'b': '2'}, uut.value)
+
     def test_processValueUsingNestedValidator(self):
         self.uut['a'](123)
         self.assertEqual({'a': 123, 'b': None}, self.uut.value)
@@ -30,6 +30,12 @@ class ISBNTestsMixin(object):
         self.assertFalse(self.uut.is_valid())
         self.assertIn('Invalid ISBN number', self.uut.errors)
 
+    def test_whenValueIsFollowedByNewline_validationFails(self):
+        self.uut(self.valid + '\n')
+
+        self.assertFalse(self.uut.is_valid())
+        self.assertEqual(['Invalid ISBN number'], self.uut.errors)
+
     def test_whenChecksumInvalid_validationFails(self):
         self.uut(self.invalid_checksum)
 